@@ -1,51 +1,225 @@
 import csv
 import json
 import os
-from datetime import datetime
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlsplit
-from urllib.request import urlopen
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # orjson is an optional speed-up; fall back to the std-lib
+    _HAS_ORJSON = False
 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Batches larger than this are split across worker processes by find_many,
+# when it is given more than one worker
+PARALLEL_FIND_THRESHOLD = 1000
+
+# Credit record returned for companies missing from the credit bureau data.
+# Shared between calls, so it must be treated as read-only.
+_EMPTY_CREDIT_RECORD: Dict[str, Any] = {
+    "credit_score": None,
+    "trade_lines": None,
+    "last_default_date": None,
+}
+
+# Result returned by CompanyLookup.find when no company matches. Shared
+# between calls, so it must be treated as read-only.
+_NO_MATCH_RESULT: Dict[str, Any] = {
+    "name": None,
+    "address": {
+        "street": None,
+        "city": None,
+        "postcode": None,
+    },
+    "domain": None,
+    "company_number": None,
+    "credit_score": None,
+    "last_default_date": None,
+    "match_confidence": "no_match",
+    "trade_lines": None,
+}
+
+# Maximum number of distinct inputs whose find results each lookup caches
+FIND_CACHE_SIZE = 10_000
+
+# Common company suffixes removed from the end of a normalised name
+_COMPANY_SUFFIXES = ("group", "inc", "llc", "ltd", "plc")
+_COMPANY_SUFFIX_RE = re.compile(rf"\s+({'|'.join(_COMPANY_SUFFIXES)})$")
+
+# Host part of a URL, without any scheme or www. prefix. A scheme or www.
+# prefix that is present must be consumed, so "http://" alone has no host.
+_DOMAIN_RE = re.compile(
+    r"(?:https?://|(?!https?://))(?:www\.|(?!www\.))([^/:?#]+)", re.IGNORECASE
+)
+
+# Translation table deleting the tabs and newlines removed from URLs, as
+# urlsplit does, before CompanyLookup.normalise_domain matches _DOMAIN_RE
+_URL_DELETE_TABLE = str.maketrans("", "", "\t\r\n")
+
+# Translation table deleting the whitespace removed from postcodes
+_POSTCODE_DELETE_TABLE = str.maketrans("", "", " \t\n\r")
+
+# Translation table deleting every ASCII character that is neither
+# alphanumeric nor whitespace, used by CompanyLookup.normalise_company_name
+_NAME_DELETE_TABLE = dict.fromkeys(
+    ord(char) for char in map(chr, range(128)) if not (char.isalnum() or char.isspace())
+)
+
+# Any character that is neither alphanumeric nor whitespace, for names that
+# contain non-ASCII characters. \w also matches "_", so it is listed too.
+_NON_ALNUM_OR_SPACE_RE = re.compile(r"[^\w\s]|_")
+
+# Date formats accepted by CompanyLookup.normalise_date:
+# "25-Jan-2025", "January 25, 2025" and "2025-01-25". Digits are ASCII only,
+# and like strptime's %d a single digit day may have a leading space.
+_DAY_MONTH_YEAR_RE = re.compile(r"([0-9]{1,2}| [1-9])-([A-Za-z]{3})-([0-9]{4})")
+_MONTH_DAY_YEAR_RE = re.compile(r"([A-Za-z]+)\s+([0-9]{1,2}),\s+([0-9]{4})")
+_ISO_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2}| [1-9])")
+
+_MONTH_NAMES = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
+_MONTHS_BY_NAME = {name: number for number, name in enumerate(_MONTH_NAMES, 1)}
+_MONTHS_BY_ABBREVIATION = {name[:3]: number for name, number in _MONTHS_BY_NAME.items()}
+
+
+@dataclass(slots=True)
+class NormalisedCompany:
+    """
+    A Companies House record together with its normalised match fields.
 
-@lru_cache(maxsize=1)
-def _public_suffixes() -> set[str]:
+    Attributes:
+        record: The original company record from Companies House
+        domain: The normalised company domain, or None
+        postcode: The normalised company postcode, or None
     """
-    Fetch the Public Suffix List once per interpreter run and cache it.
-    Falls back to a small built-in set if the download fails or you are offline.
-    Only the std-lib is used.
+
+    record: Dict[str, Any]
+    domain: Optional[str]
+    postcode: Optional[str]
+
+
+@dataclass(slots=True)
+class _TrieNode:
+    children: Dict[str, "_TrieNode"] = field(default_factory=dict)
+    name: Optional[str] = None
+
+
+class CompanyNameTrie:
     """
-    # A minimal embedded set so the function still works when offline.
-    builtin = {
-        "ac.uk",
-        "gov.uk",
-        "uk",
-        "org",
-        "net",
-        "edu",
-        "gov",
-        "io",
-        "ai",
-        "dev",
-        "biz",
-        "co.uk",
-        "com",
-        "info",
-    }
-
-    url = "https://publicsuffix.org/list/public_suffix_list.dat"
-    try:
-        with urlopen(url, timeout=3) as fp:
-            return {
-                line.decode().strip()
-                for line in fp
-                if line and not line.startswith(b"//")
-            }
-    except Exception:
-        # Network unavailable or blocked – use the built-in subset.
-        return builtin
+    A character trie over normalised company names.
+
+    Shared prefixes are stored once, which allows a bounded edit-distance
+    search to prune every branch that can no longer come within the
+    allowed number of edits.
+
+    Examples:
+        >>> trie = CompanyNameTrie()
+        >>> trie.insert("tyler")
+        >>> trie.search("tylor", max_edits=1)
+        ['tyler']
+    """
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+
+    def insert(self, name: str) -> None:
+        """
+        Add a normalised company name to the trie.
+
+        Args:
+            name: The normalised company name to add
+        """
+        node = self._root
+        for char in name:
+            node = node.children.setdefault(char, _TrieNode())
+        node.name = name
+
+    def search(self, name: str, max_edits: int = 1) -> List[str]:
+        """
+        Find all names within a Levenshtein distance of the given name.
+
+        Walks the trie depth first, carrying one row of the edit-distance
+        matrix per node and abandoning a branch as soon as every entry in
+        its row exceeds max_edits.
+
+        Args:
+            name: The normalised company name to search for
+            max_edits: The maximum number of single character insertions,
+                deletions or substitutions allowed
+
+        Returns:
+            The matching names, in trie order
+        """
+        matches: List[str] = []
+        first_row = list(range(len(name) + 1))
+
+        for char, child in self._root.children.items():
+            self._search(child, char, name, first_row, max_edits, matches)
+
+        return matches
+
+    def _search(
+        self,
+        node: _TrieNode,
+        char: str,
+        name: str,
+        previous_row: List[int],
+        max_edits: int,
+        matches: List[str],
+    ) -> None:
+        row = [previous_row[0] + 1]
+        for i, name_char in enumerate(name, 1):
+            row.append(
+                min(
+                    row[i - 1] + 1,
+                    previous_row[i] + 1,
+                    previous_row[i - 1] + (name_char != char),
+                )
+            )
+
+        if node.name is not None and row[-1] <= max_edits:
+            matches.append(node.name)
+
+        if min(row) <= max_edits:
+            for next_char, child in node.children.items():
+                self._search(child, next_char, name, row, max_edits, matches)
+
+
+def _to_int(value: Optional[str]) -> Optional[int]:
+    return int(value) if value else None
+
+
+# The CompanyLookup held by each find_many worker process
+_worker_company_lookup: Optional["CompanyLookup"] = None
+
+
+def _init_find_many_worker(company_lookup: "CompanyLookup") -> None:
+    global _worker_company_lookup
+    _worker_company_lookup = company_lookup
+
+
+def _find_many_in_worker(inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    assert _worker_company_lookup is not None, "worker was not initialised"
+    return _worker_company_lookup.find_many(inputs)
 
 
 class CompanyLookup:
@@ -61,13 +235,18 @@ class CompanyLookup:
 
     Attributes:
         companies_house_data: List of company records from Companies House
-        credit_bureau_data: List of credit records from credit bureau
-        company_name_lookup: Dictionary mapping normalised names to company records
+        company_name_lookup: Dictionary mapping normalised names to
+            NormalisedCompany entries
+        company_name_trie: Trie over normalised names, used for fuzzy
+            matching when fuzzy_match is enabled
         credit_bureau_lookup: Dictionary mapping company numbers to credit records
     """
 
     def __init__(
-        self, companies_house_filepath: str, credit_bureau_filepath: str
+        self,
+        companies_house_filepath: str,
+        credit_bureau_filepath: str,
+        fuzzy_match: bool = False,
     ) -> None:
         """
         Initialize the CompanyLookup with reference data.
@@ -75,6 +254,12 @@ class CompanyLookup:
         Loads data from Companies House and credit bureau files, then builds
         normalised lookup dictionaries for efficient matching.
 
+        Args:
+            companies_house_filepath: Path of the Companies House JSON file
+            credit_bureau_filepath: Path of the credit bureau CSV file
+            fuzzy_match: If True, a name with no exact match falls back to the
+                single company name within one edit of it, if there is one
+
         Raises:
             FileNotFoundError: If reference data files are not found
             ValueError: If company data contains invalid names
@@ -82,16 +267,35 @@ class CompanyLookup:
 
         self.companies_house_filepath = companies_house_filepath
         self.credit_bureau_filepath = credit_bureau_filepath
+        self.fuzzy_match = fuzzy_match
 
         self.companies_house_data: List[Dict[str, Any]] = []
-        self.credit_bureau_data: List[Dict[str, Any]] = []
-        self.company_name_lookup: Dict[str, Dict[str, Any]] = {}
+        self.company_name_lookup: Dict[str, NormalisedCompany] = {}
+        self.company_name_trie = CompanyNameTrie()
         self.credit_bureau_lookup: Dict[str, Dict[str, Any]] = {}
 
+        self._create_find_cache()
+
         self.load_reference_data()
         self.build_normalised_company_data_lookups()
         self.build_credit_bureau_data_lookups()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # The find cache wraps a bound method and cannot be pickled
+        state = self.__dict__.copy()
+        del state["_find_cached"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._create_find_cache()
+
+    def _create_find_cache(self) -> None:
+        # The cache holds the bound _find, so it forms a reference cycle with
+        # self: the instance and its cached results are only freed once the
+        # cyclic garbage collector runs
+        self._find_cached = lru_cache(maxsize=FIND_CACHE_SIZE)(self._find)
+
     @staticmethod
     def normalise_company_name(name: Optional[str]) -> Optional[str]:
         """
@@ -132,16 +336,18 @@ class CompanyLookup:
         name = " ".join(name.split())
 
         # Remove common suffixes from end of string {'Group', 'Inc', 'LLC', 'Ltd', 'PLC'}
-        suffixes = {"group", "inc", "llc", "ltd", "plc"}
-        for suffix in suffixes:
-            if name.endswith(suffix):
-                name = name[: -(len(suffix) + 1)].strip()
+        # Most names have no suffix, so check with endswith before the regex
+        if name.endswith(_COMPANY_SUFFIXES):
+            name = _COMPANY_SUFFIX_RE.sub("", name)
 
         # Normalise "&" to "and"
         name = name.replace("&", "and")
 
         # Remove any remaining special characters
-        name = "".join(char for char in name if char.isalnum() or char.isspace())
+        if name.isascii():
+            name = name.translate(_NAME_DELETE_TABLE)
+        else:
+            name = _NON_ALNUM_OR_SPACE_RE.sub("", name)
 
         # Remove any remaining leading or trailing whitespace
         name = name.strip()
@@ -164,7 +370,7 @@ class CompanyLookup:
         >>> CompanyLookup.normalise_domain("https://www.example.com:8080/path?q=1")
         'example.com'
         >>> CompanyLookup.normalise_domain("sub.domain.co.uk")
-        'domain.co.uk'
+        'sub.domain.co.uk'
         """
         if not url:
             return None
@@ -179,26 +385,10 @@ class CompanyLookup:
         if url.startswith("@"):
             url = url[1:]
 
-        # If URL doesn't have a scheme, add one for parsing
-        if not url.lower().startswith(("http://", "https://")):
-            url = "http://" + url
-
-        # Parse the URL
-        parsed = urlsplit(url)
-        domain = parsed.netloc
-
-        # Remove port if present
-        if ":" in domain:
-            domain = domain.split(":")[0]
-
-        # Remove www. prefix (case-insensitive)
-        if domain.lower().startswith("www."):
-            domain = domain[4:]
+        # Extract the host, dropping any scheme, www. prefix, port and path
+        match = _DOMAIN_RE.match(url.translate(_URL_DELETE_TABLE))
 
-        # Convert to lowercase
-        domain = domain.lower()
-
-        return domain if domain else None
+        return match.group(1).lower() if match else None
 
     @staticmethod
     def normalise_post_code(postcode: Optional[str]) -> Optional[str]:
@@ -223,14 +413,8 @@ class CompanyLookup:
         if not postcode:
             return None
 
-        # Remove leading and trailing whitespace and convert to uppercase
-        postcode = postcode.strip().upper()
-
-        # Remove special characters like \n, \r, and \t
-        postcode = postcode.replace("\n", "").replace("\r", "").replace("\t", "")
-
-        # Remove all spaces
-        postcode = postcode.replace(" ", "")
+        # Strip and uppercase, then remove all spaces, \n, \r and \t in one pass
+        postcode = postcode.strip().upper().translate(_POSTCODE_DELETE_TABLE)
 
         return postcode if postcode else None
 
@@ -260,23 +444,71 @@ class CompanyLookup:
         if not date_str:
             return None
 
-        # Try to parse the date in different formats
+        # Classify the format with a regex match rather than trying strptime
+        # for each format in turn
+        if match := _DAY_MONTH_YEAR_RE.fullmatch(date_str):
+            day, month_name, year = match.groups()
+            month = _MONTHS_BY_ABBREVIATION.get(month_name.lower())
+
+        elif match := _MONTH_DAY_YEAR_RE.fullmatch(date_str):
+            month_name, day, year = match.groups()
+            month = _MONTHS_BY_NAME.get(month_name.lower())
+
+        elif match := _ISO_DATE_RE.fullmatch(date_str):
+            year, month_number, day = match.groups()
+            month = int(month_number)
+
+        else:
+            raise ValueError(f"Invalid date format: {date_str}")
+
+        if month is None:
+            raise ValueError(f"Invalid date format: {date_str}")
+
         try:
-            # Try parsing "25-Jan-2025"
-            return datetime.strptime(date_str, "%d-%b-%Y").date().isoformat()
+            return date(int(year), month, int(day)).isoformat()
 
         except ValueError:
-            try:
-                # Try parsing "January 25, 2025"
-                return datetime.strptime(date_str, "%B %d, %Y").date().isoformat()
+            raise ValueError(f"Invalid date format: {date_str}")
+
+    @staticmethod
+    def derive_match_confidence(
+        input_domain: Optional[str],
+        input_postcode: Optional[str],
+        company_domain: Optional[str],
+        company_postcode: Optional[str],
+    ) -> str:
+        """
+        Derive the match confidence for a name match from normalised fields.
+
+        All arguments must already be normalised, so no string work is
+        repeated here.
 
-            except ValueError:
-                try:
-                    # Try parsing "2025-01-25"
-                    return datetime.strptime(date_str, "%Y-%m-%d").date().isoformat()
+        Args:
+            input_domain: The normalised input domain
+            input_postcode: The normalised input postcode
+            company_domain: The normalised domain of the matched company
+            company_postcode: The normalised postcode of the matched company
 
-                except ValueError:
-                    raise ValueError(f"Invalid date format: {date_str}")
+        Returns:
+            'high' if both domain and postcode match, 'medium' if one of them
+            matches, otherwise 'low'
+
+        Examples:
+            >>> CompanyLookup.derive_match_confidence(
+            ...     "acme.com", "SW1A1AA", "acme.com", "M11AA"
+            ... )
+            'medium'
+        """
+        domain_matches = input_domain == company_domain
+        postcode_matches = input_postcode == company_postcode
+
+        if domain_matches and postcode_matches:
+            return "high"
+
+        if domain_matches or postcode_matches:
+            return "medium"
+
+        return "low"
 
     def build_normalised_company_data_lookups(self) -> None:
         """
@@ -284,84 +516,128 @@ class CompanyLookup:
 
         Creates a dictionary mapping normalised company names to their
         corresponding company records for efficient lookup during matching.
+        The normalised domain and postcode of each record are computed once
+        here and stored alongside it, so matching only normalises the input.
+        When fuzzy matching is enabled the names are also added to a trie.
+        Any cached find results are discarded.
 
         Raises:
             ValueError: If a company has an invalid name that cannot be normalised
         """
-        self.company_name_lookup = {}
+        company_name_lookup = self.company_name_lookup = {}
+        company_name_trie = self.company_name_trie = CompanyNameTrie()
+
+        # Bind the per-record helpers to locals once, outside the loop
+        normalise_company_name = self.normalise_company_name
+        normalise_domain = self.normalise_domain
+        normalise_post_code = self.normalise_post_code
+        fuzzy_match = self.fuzzy_match
 
         for company in self.companies_house_data:
-            normalised_name = self.normalise_company_name(company["name"])
+            normalised_name = normalise_company_name(company["name"])
 
             if not normalised_name:
                 raise ValueError(f"Invalid company name: {company['name']}")
 
-            self.company_name_lookup[normalised_name] = company
+            company_name_lookup[normalised_name] = NormalisedCompany(
+                company,
+                normalise_domain(company["domain"]),
+                normalise_post_code(company["address"]["postcode"]),
+            )
+
+            if fuzzy_match:
+                company_name_trie.insert(normalised_name)
+
+        self._find_cached.cache_clear()
 
     def build_credit_bureau_data_lookups(self) -> None:
         """
         Build lookup dictionary for credit bureau data.
 
-        Creates a dictionary mapping company numbers to their credit records,
-        with normalised date formats and duplicate handling.
+        Streams records from the credit bureau CSV file straight into a
+        dictionary mapping company numbers to their credit records, with
+        normalised date formats and duplicate handling. Any cached find
+        results are discarded.
+
+        Raises:
+            FileNotFoundError: If the credit bureau file is not found
         """
-        self.credit_bureau_lookup = {}
+        credit_bureau_lookup = self.credit_bureau_lookup = {}
+
+        # Bind the per-record helper to a local once, outside the loop
+        normalise_date = self.normalise_date
 
-        for record in self.credit_bureau_data:
+        for record in self.iter_csv_file(self.credit_bureau_filepath):
             company_number = str(record["company_number"])
-            if company_number in self.credit_bureau_lookup:
+            if company_number in credit_bureau_lookup:
                 continue
 
-            record["last_default_date"] = self.normalise_date(
-                record["last_default_date"]
-            )
+            record["last_default_date"] = normalise_date(record["last_default_date"])
+
+            credit_bureau_lookup[company_number] = record
 
-            self.credit_bureau_lookup[company_number] = record
+        self._find_cached.cache_clear()
+
+    def find_fuzzy_company(self, normalised_name: str) -> Optional[NormalisedCompany]:
+        """
+        Find the company whose normalised name is one edit away from the input.
+
+        Only used when the exact lookup misses. Ambiguous names, with more than
+        one company within one edit, are treated as no match so the result
+        stays deterministic.
+
+        Args:
+            normalised_name: The normalised company name to match
+
+        Returns:
+            The matching NormalisedCompany entry, or None
+        """
+        candidates = self.company_name_trie.search(normalised_name, max_edits=1)
+
+        if len(candidates) != 1:
+            return None
+
+        return self.company_name_lookup[candidates[0]]
 
     def get_credit_bureau_record(self, company_number: str) -> Dict[str, Any]:
         """
         Retrieve credit bureau record for a given company number.
 
-        Returns the credit record if found, otherwise returns a default
-        record with None values.
+        Returns the credit record if found, otherwise returns a shared
+        default record with None values. The returned record must be
+        treated as read-only.
 
         Args:
             company_number: The company number to look up
 
         Returns:
             Dictionary containing credit bureau information with keys:
-            - company_number: The company number
             - credit_score: Credit score or None
             - trade_lines: Number of trade lines or None
             - last_default_date: Last default date or None
         """
-        if self.credit_bureau_lookup.get(company_number):
-            return self.credit_bureau_lookup[company_number]
-
-        return {
-            "company_number": company_number,
-            "credit_score": None,
-            "trade_lines": None,
-            "last_default_date": None,
-        }
+        return self.credit_bureau_lookup.get(company_number, _EMPTY_CREDIT_RECORD)
 
     def load_reference_data(self) -> None:
         """
-        Load reference data from Companies House and credit bureau files.
+        Load reference data from the Companies House file.
 
-        Loads JSON data for Companies House and CSV data for credit bureau
-        from the data directory.
+        Loads JSON data for Companies House from the data directory. Credit
+        bureau data is streamed directly into its lookup by
+        build_credit_bureau_data_lookups.
 
         Raises:
-            FileNotFoundError: If reference data files are not found
+            FileNotFoundError: If the reference data file is not found
         """
         self.companies_house_data = self.load_json_file(self.companies_house_filepath)
-        self.credit_bureau_data = self.load_csv_file(self.credit_bureau_filepath)
 
     def load_json_file(self, file_path: str) -> List[Dict[str, Any]]:
         """
         Load data from a JSON file.
 
+        Uses orjson for parsing when it is installed, otherwise the std-lib
+        json module.
+
         Args:
             file_path: Path of the JSON file to load
 
@@ -374,18 +650,22 @@ class CompanyLookup:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File {file_path} not found in data directory.")
 
+        if _HAS_ORJSON:
+            with open(file_path, "rb") as file:
+                return orjson.loads(file.read())
+
         with open(file_path, "r") as file:
             return json.load(file)
 
-    def load_csv_file(self, file_path: str) -> List[Dict[str, Any]]:
+    def iter_csv_file(self, file_path: str) -> Iterator[Dict[str, Any]]:
         """
-        Load data from a CSV file.
+        Iterate over the rows of a CSV file without materialising them.
 
         Args:
-            file_path: Path of the CSV file to load
+            file_path: Path of the CSV file to read
 
-        Returns:
-            List of dictionaries parsed from the CSV file
+        Yields:
+            Dictionaries parsed from the CSV file, one per row
 
         Raises:
             FileNotFoundError: If the file is not found in the data directory
@@ -393,8 +673,8 @@ class CompanyLookup:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File {file_path} not found in data directory.")
 
-        with open(file_path, "r") as file:
-            return [row for row in csv.DictReader(file)]
+        with open(file_path, "r", newline="") as file:
+            yield from csv.DictReader(file)
 
     def find(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -404,6 +684,11 @@ class CompanyLookup:
         using normalised company names. Determines match confidence based on
         domain and postcode matching, and enriches results with credit data.
 
+        Results are cached per instance, keyed on the input name, website and
+        postcode, so repeated inputs return the same dictionary, and every
+        no match returns one shared dictionary. Callers must treat the result
+        as read-only.
+
         Args:
             input_data: Dictionary containing company information with keys:
                 - name: Company name
@@ -433,37 +718,140 @@ class CompanyLookup:
             >>> result["match_confidence"]
             'high'
         """
-        input_name: str = input_data["name"]
-        input_website: str = input_data["website"]
-        input_postcode: str = input_data["postcode"]
-
+        return self._find_cached(
+            input_data["name"], input_data["website"], input_data["postcode"]
+        )
+
+    def _find(
+        self,
+        input_name: Optional[str],
+        input_website: Optional[str],
+        input_postcode: Optional[str],
+    ) -> Dict[str, Any]:
         normalised_input_name = self.normalise_company_name(input_name)
 
-        if self.company_name_lookup.get(normalised_input_name):
-            matched_company = self.company_name_lookup[normalised_input_name]
+        return self.build_find_result(
+            self.match_company_name(normalised_input_name),
+            input_website,
+            input_postcode,
+        )
 
-            normalised_input_domain = self.normalise_domain(input_website)
-            normalised_input_postcode = self.normalise_post_code(input_postcode)
+    def find_many(
+        self, inputs: List[Dict[str, Any]], max_workers: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Find and match a batch of company data against reference sources.
+
+        Equivalent to calling find on each input, but normalises all input
+        names in one pass before doing the lookups, and only normalises the
+        website and postcode of inputs whose name matched.
+
+        When max_workers is greater than 1, batches larger than
+        PARALLEL_FIND_THRESHOLD are split into chunks and matched in a new
+        pool of worker processes, each of which receives a copy of this
+        lookup when it starts. Starting the pool costs far more than matching
+        a single input, so it only pays off for very large batches, and under
+        the spawn or forkserver start methods the caller needs a
+        ``if __name__ == "__main__"`` guard.
+
+        Args:
+            inputs: List of dictionaries in the same shape accepted by find
+            max_workers: Maximum number of worker processes to use for large
+                batches. Defaults to 1, which matches in this process
 
-            normalised_company_domain = self.normalise_domain(matched_company["domain"])
-            normalised_company_postcode = self.normalise_post_code(
-                matched_company["address"]["postcode"]
+        Returns:
+            List of dictionaries in the same shape returned by find, in the
+            same order as the inputs. As with find, they must be treated as
+            read-only
+        """
+        if max_workers > 1 and len(inputs) > PARALLEL_FIND_THRESHOLD:
+            chunk_size = max(1, len(inputs) // (4 * max_workers))
+            chunks = [
+                inputs[start : start + chunk_size]
+                for start in range(0, len(inputs), chunk_size)
+            ]
+
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_find_many_worker,
+                initargs=(self,),
+            ) as executor:
+                return [
+                    result
+                    for chunk_results in executor.map(_find_many_in_worker, chunks)
+                    for result in chunk_results
+                ]
+
+        normalise_company_name = self.normalise_company_name
+        match_company_name = self.match_company_name
+        build_find_result = self.build_find_result
+
+        normalised_names = [
+            normalise_company_name(input_data["name"]) for input_data in inputs
+        ]
+        lookup_entries = [match_company_name(name) for name in normalised_names]
+
+        return [
+            build_find_result(
+                lookup_entry, input_data["website"], input_data["postcode"]
             )
+            for lookup_entry, input_data in zip(lookup_entries, inputs)
+        ]
+
+    def match_company_name(
+        self, normalised_name: Optional[str]
+    ) -> Optional[NormalisedCompany]:
+        """
+        Look up the company for a normalised input name.
+
+        Uses the exact name lookup, falling back to fuzzy matching when it
+        is enabled.
+
+        Args:
+            normalised_name: The normalised company name to match
+
+        Returns:
+            The matching NormalisedCompany entry, or None
+        """
+        lookup_entry = self.company_name_lookup.get(normalised_name)
+
+        if lookup_entry is None and self.fuzzy_match and normalised_name:
+            lookup_entry = self.find_fuzzy_company(normalised_name)
+
+        return lookup_entry
+
+    def build_find_result(
+        self,
+        lookup_entry: Optional[NormalisedCompany],
+        input_website: Optional[str],
+        input_postcode: Optional[str],
+    ) -> Dict[str, Any]:
+        """
+        Build the result of a lookup for a matched company, or a no match.
+
+        The input website and postcode are only normalised when a company
+        was matched.
+
+        Args:
+            lookup_entry: The matched company entry, or None for no match
+            input_website: The website supplied with the input
+            input_postcode: The postcode supplied with the input
 
-            if (
-                normalised_input_domain == normalised_company_domain
-                and normalised_input_postcode == normalised_company_postcode
-            ):
-                match_confidence = "high"
+        Returns:
+            Dictionary in the shape documented on find
+        """
+        if lookup_entry is not None:
+            matched_company = lookup_entry.record
 
-            elif (
-                normalised_input_domain == normalised_company_domain
-                or normalised_input_postcode == normalised_company_postcode
-            ):
-                match_confidence = "medium"
+            normalised_input_domain = self.normalise_domain(input_website)
+            normalised_input_postcode = self.normalise_post_code(input_postcode)
 
-            else:
-                match_confidence = "low"
+            match_confidence = self.derive_match_confidence(
+                normalised_input_domain,
+                normalised_input_postcode,
+                lookup_entry.domain,
+                lookup_entry.postcode,
+            )
 
             credit_record = self.get_credit_bureau_record(
                 matched_company["company_number"]
@@ -474,32 +862,11 @@ class CompanyLookup:
                 "address": matched_company["address"],
                 "domain": matched_company["domain"],
                 "company_number": matched_company["company_number"],
-                "credit_score": (
-                    int(credit_record["credit_score"])
-                    if credit_record["credit_score"]
-                    else None
-                ),
+                "credit_score": _to_int(credit_record["credit_score"]),
                 "last_default_date": credit_record["last_default_date"],
                 "match_confidence": match_confidence,
-                "trade_lines": (
-                    int(credit_record["trade_lines"])
-                    if credit_record["trade_lines"]
-                    else None
-                ),
+                "trade_lines": _to_int(credit_record["trade_lines"]),
             }
 
         else:
-            return {
-                "name": None,
-                "address": {
-                    "street": None,
-                    "city": None,
-                    "postcode": None,
-                },
-                "domain": None,
-                "company_number": None,
-                "credit_score": None,
-                "last_default_date": None,
-                "match_confidence": "no_match",
-                "trade_lines": None,
-            }
+            return _NO_MATCH_RESULT
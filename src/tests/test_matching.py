@@ -3,7 +3,8 @@ import pathlib
 
 import pytest
 
-from src.company_lookup import CompanyLookup
+from src import company_lookup as company_lookup_module
+from src.company_lookup import PARALLEL_FIND_THRESHOLD, CompanyLookup
 
 HIGH_CONFIDENCE_DATA_FILE = (
     pathlib.Path(__file__).parent / "test_data" / "high_confidence_test_data.json"
@@ -29,6 +30,15 @@ def company_lookup():
     )
 
 
+@pytest.fixture(scope="session")
+def fuzzy_company_lookup():
+    return CompanyLookup(
+        companies_house_filepath=DATA_DIR / "companies_house.json",
+        credit_bureau_filepath=DATA_DIR / "credit_bureau.csv",
+        fuzzy_match=True,
+    )
+
+
 def load_high_confidence_cases():
     """Return an iterable of pytest.param for @parametrize."""
 
@@ -95,3 +105,146 @@ def test_low_confidence_matches(company_lookup, input, expected_output):
 @pytest.mark.parametrize("input, expected_output", list(load_no_match_cases()))
 def test_no_match_cases(company_lookup, input, expected_output):
     assert company_lookup.find(input) == expected_output
+
+
+def test_load_json_file_without_orjson(company_lookup, monkeypatch):
+    file_path = DATA_DIR / "companies_house.json"
+    with open(file_path) as f:
+        expected = json.load(f)
+
+    assert company_lookup.load_json_file(file_path) == expected
+
+    monkeypatch.setattr(company_lookup_module, "_HAS_ORJSON", False)
+
+    assert company_lookup.load_json_file(file_path) == expected
+
+
+def test_find_caches_repeated_inputs(company_lookup):
+    input = {"name": "Potts Inc", "address": "", "postcode": "", "website": ""}
+
+    assert company_lookup.find(input) is company_lookup.find(dict(input))
+
+
+def test_rebuilding_lookups_clears_find_cache():
+    company_lookup = CompanyLookup(
+        companies_house_filepath=DATA_DIR / "companies_house.json",
+        credit_bureau_filepath=DATA_DIR / "credit_bureau.csv",
+    )
+    input = {"name": "Potts Inc", "address": "", "postcode": "", "website": ""}
+    assert company_lookup.find(input)["match_confidence"] == "low"
+
+    company_lookup.companies_house_data = []
+    company_lookup.build_normalised_company_data_lookups()
+
+    assert company_lookup.find(input)["match_confidence"] == "no_match"
+
+
+def test_find_many_matches_find(company_lookup):
+    cases = [
+        case.values
+        for case in (
+            *load_high_confidence_cases(),
+            *load_medium_confidence_cases(),
+            *load_low_confidence_cases(),
+            *load_no_match_cases(),
+        )
+    ]
+    inputs = [input for input, _ in cases]
+    expected_outputs = [expected_output for _, expected_output in cases]
+
+    assert company_lookup.find_many(inputs) == expected_outputs
+
+
+def test_find_many_in_worker_processes_preserves_order(company_lookup):
+    cases = [
+        case.values for case in (*load_high_confidence_cases(), *load_no_match_cases())
+    ]
+    repeats = PARALLEL_FIND_THRESHOLD // len(cases) + 1
+    inputs = [input for input, _ in cases] * repeats
+    expected_outputs = [expected_output for _, expected_output in cases] * repeats
+
+    assert company_lookup.find_many(inputs, max_workers=2) == expected_outputs
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        pytest.param("Potts Inc", "potts", id="suffix_removed"),
+        pytest.param("ACME Corp. Ltd", "acme corp", id="suffix_after_punctuation"),
+        pytest.param("Zinc", "zinc", id="suffix_without_separator_kept"),
+        pytest.param("Ltd", "ltd", id="suffix_only_kept"),
+    ],
+)
+def test_normalise_company_name_suffixes(name, expected):
+    assert CompanyLookup.normalise_company_name(name) == expected
+
+
+def test_fuzzy_match_within_one_edit(fuzzy_company_lookup):
+    input = {
+        "name": "Pots Inc",
+        "address": "Studio 09K\nKate motorway",
+        "postcode": "M3 5WX",
+        "website": "kelly-osullivan.com",
+    }
+    result = fuzzy_company_lookup.find(input)
+
+    assert result["company_number"] == "7737268"
+    assert result["match_confidence"] == "high"
+
+
+def test_fuzzy_match_ambiguous_name_is_no_match(fuzzy_company_lookup):
+    # "tylor" is one edit away from both "tyler" and "taylor"
+    input = {"name": "Tylor", "address": "", "postcode": "", "website": ""}
+
+    assert fuzzy_company_lookup.find(input)["match_confidence"] == "no_match"
+
+
+def test_fuzzy_match_disabled_by_default(company_lookup):
+    input = {"name": "Pots Inc", "address": "", "postcode": "", "website": ""}
+
+    assert company_lookup.find(input)["match_confidence"] == "no_match"
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        pytest.param("https://www.example.com:8080/path?q=1", "example.com", id="full"),
+        pytest.param("HTTPS://WWW.EXAMPLE.COM", "example.com", id="upper_case"),
+        pytest.param("www.exam\nple.com", "example.com", id="embedded_newline"),
+        pytest.param("acme.com\r\n/about", "acme.com", id="embedded_crlf"),
+        pytest.param("ex\tample.com", "example.com", id="embedded_tab"),
+        pytest.param("ftp://x", "ftp", id="unsupported_scheme"),
+        pytest.param("http://", None, id="bare_scheme"),
+        pytest.param("www.", None, id="bare_www"),
+        pytest.param("", None, id="empty"),
+    ],
+)
+def test_normalise_domain(url, expected):
+    assert CompanyLookup.normalise_domain(url) == expected
+
+
+@pytest.mark.parametrize(
+    "date_str, expected",
+    [
+        pytest.param("25-Jan-2025", "2025-01-25", id="day_month_year"),
+        pytest.param(" 5-jan-2025", "2025-01-05", id="day_month_year_padded_day"),
+        pytest.param("January 25, 2025", "2025-01-25", id="month_day_year"),
+        pytest.param("2025-01-25", "2025-01-25", id="iso"),
+        pytest.param("", None, id="empty"),
+    ],
+)
+def test_normalise_date(date_str, expected):
+    assert CompanyLookup.normalise_date(date_str) == expected
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        pytest.param("25/01/2025", id="unknown_format"),
+        pytest.param("30-Feb-2025", id="invalid_day"),
+        pytest.param("2025-02-１", id="non_ascii_digit"),
+    ],
+)
+def test_normalise_date_invalid(date_str):
+    with pytest.raises(ValueError):
+        CompanyLookup.normalise_date(date_str)